@@ -1,3 +1,5 @@
+import concurrent.futures
+import io
 import os
 import re
 import sqlite3
@@ -6,10 +8,13 @@ import json
 import requests
 import streamlit as st
 from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, parse_qs
+from urllib3.util.retry import Retry
 
 from xml.etree import ElementTree as ET
 from openai import OpenAI
+from streamlit_autorefresh import st_autorefresh
 
 APP_DB_PATH = "video_agent.db"
 REQUEST_HEADERS = {
@@ -17,6 +22,24 @@ REQUEST_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+_CHANNEL_ID_RE = re.compile(r"UC[0-9A-Za-z_-]{22}")
+_URL_CHANNEL_RE = re.compile(r"/channel/(UC[0-9A-Za-z_-]{22})")
+# Bytes pattern so page bodies can be scanned without decoding ~1MB of HTML.
+_PAGE_CHANNEL_RE = re.compile(rb'"channelId":"(UC[0-9A-Za-z_-]{22})"')
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_session() -> requests.Session:
+    # Shared Session so YouTube/Google calls reuse pooled keep-alive connections
+    # across Streamlit reruns instead of redoing a TLS handshake per request.
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(REQUEST_HEADERS)
+    return session
+
 # ----------------------------- Database ------------------------------------
 def init_db(conn: sqlite3.Connection):
     cur = conn.cursor()
@@ -41,12 +64,31 @@ def init_db(conn: sqlite3.Connection):
             seen INTEGER DEFAULT 0
         );
     """)
-    conn.commit()
+    # Lightweight migration for DBs created before conditional-GET support.
+    for col in ("last_etag", "last_modified"):
+        try:
+            cur.execute(f"ALTER TABLE channels ADD COLUMN {col} TEXT")
+        except sqlite3.OperationalError:
+            pass
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_channel_pub ON videos(channel_id, published_at DESC)")
+    # Partial index: stays tiny because most rows end up seen=1.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_unseen ON videos(seen, channel_id, published_at DESC) WHERE seen = 0")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_pub ON videos(published_at DESC)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_channels_added ON channels(added_at DESC)")
+    cur.execute("ANALYZE")
 
 
 @st.cache_resource(show_spinner=False)
 def get_db():
-    conn = sqlite3.connect(APP_DB_PATH, check_same_thread=False)
+    # isolation_level=None puts sqlite3 in autocommit mode; write helpers
+    # open their own BEGIN IMMEDIATE/COMMIT so reads never hold a transaction.
+    conn = sqlite3.connect(APP_DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
     init_db(conn)
     return conn
 
@@ -54,162 +96,185 @@ def get_db():
 def add_channel(conn: sqlite3.Connection, channel_id: str, title: str = "", url: str = "") -> bool:
     cur = conn.cursor()
     try:
+        cur.execute("BEGIN IMMEDIATE")
         cur.execute(
             "INSERT INTO channels(channel_id, title, url, added_at, last_checked) VALUES (?, ?, ?, ?, ?)",
             (channel_id, title, url, utc_now_iso(), None),
         )
-        conn.commit()
+        cur.execute("COMMIT")
         return True
     except sqlite3.IntegrityError:
+        cur.execute("ROLLBACK")
         return False
 
 
 def remove_channel(conn: sqlite3.Connection, channel_id: str) -> None:
     cur = conn.cursor()
+    cur.execute("BEGIN IMMEDIATE")
     cur.execute("DELETE FROM videos WHERE channel_id = ?", (channel_id,))
     cur.execute("DELETE FROM channels WHERE channel_id = ?", (channel_id,))
-    conn.commit()
+    cur.execute("COMMIT")
 
 
 def list_channels(conn: sqlite3.Connection):
     cur = conn.cursor()
-    cur.execute("SELECT channel_id, title, url, added_at, last_checked FROM channels ORDER BY added_at DESC")
-    rows = cur.fetchall()
-    return [
-        {
-            "channel_id": r[0],
-            "title": r[1] or "",
-            "url": r[2] or f"https://www.youtube.com/channel/{r[0]}",
-            "added_at": r[3],
-            "last_checked": r[4],
-        }
-        for r in rows
-    ]
+    cur.execute(
+        """
+        SELECT channel_id,
+               COALESCE(title, '') AS title,
+               COALESCE(NULLIF(url, ''), 'https://www.youtube.com/channel/' || channel_id) AS url,
+               added_at,
+               last_checked,
+               last_etag,
+               last_modified
+        FROM channels
+        ORDER BY added_at DESC
+        """
+    )
+    return [dict(r) for r in cur.fetchall()]
 
 
 def insert_videos(conn: sqlite3.Connection, channel_id: str, videos: list):
+    if not videos:
+        return 0
+    now = utc_now_iso()
+    rows = [
+        (
+            v["video_id"],
+            channel_id,
+            v.get("title") or "",
+            v.get("published_at") or "",
+            v.get("description") or "",
+            v.get("url") or f"https://www.youtube.com/watch?v={v['video_id']}",
+            now,
+        )
+        for v in videos
+    ]
     cur = conn.cursor()
-    inserted = 0
-    for v in videos:
-        try:
-            cur.execute(
-                """
-                INSERT INTO videos(video_id, channel_id, title, published_at, description, url, added_at, seen)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
-                """,
-                (
-                    v["video_id"],
-                    channel_id,
-                    v.get("title") or "",
-                    v.get("published_at") or "",
-                    v.get("description") or "",
-                    v.get("url") or f"https://www.youtube.com/watch?v={v['video_id']}",
-                    utc_now_iso(),
-                ),
-            )
-            inserted += 1
-        except sqlite3.IntegrityError:
-            # Already exists
-            pass
-    conn.commit()
+    cur.execute("BEGIN IMMEDIATE")
+    cur.executemany(
+        """
+        INSERT OR IGNORE INTO videos(video_id, channel_id, title, published_at, description, url, added_at, seen)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+        """,
+        rows,
+    )
+    inserted = cur.rowcount
+    cur.execute("COMMIT")
     return inserted
 
 
-def mark_channel_checked(conn: sqlite3.Connection, channel_id: str):
+def mark_channel_checked(conn: sqlite3.Connection, channel_id: str, etag: str = "", modified: str = ""):
     cur = conn.cursor()
-    cur.execute("UPDATE channels SET last_checked = ? WHERE channel_id = ?", (utc_now_iso(), channel_id))
-    conn.commit()
+    cur.execute("BEGIN IMMEDIATE")
+    cur.execute(
+        "UPDATE channels SET last_checked = ?, last_etag = ?, last_modified = ? WHERE channel_id = ?",
+        (utc_now_iso(), etag, modified, channel_id),
+    )
+    cur.execute("COMMIT")
 
 
 def get_unseen_videos(conn: sqlite3.Connection, channel_id: str = None, limit: int = 100):
     cur = conn.cursor()
+    # Apply the LIMIT inside the CTE so only the returned rows are joined
+    # against channels, instead of joining every matching video first.
     if channel_id:
         cur.execute(
             """
-            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url, c.title
-            FROM videos v
-            JOIN channels c ON v.channel_id = c.channel_id
-            WHERE v.seen = 0 AND v.channel_id = ?
+            WITH v AS (
+                SELECT video_id, channel_id, title, published_at, substr(description, 1, 320) AS description, url
+                FROM videos
+                WHERE seen = 0 AND channel_id = ?
+                ORDER BY published_at DESC
+                LIMIT ?
+            )
+            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url,
+                   COALESCE(NULLIF(c.title, ''), v.channel_id) AS channel_title
+            FROM v
+            LEFT JOIN channels c ON v.channel_id = c.channel_id
             ORDER BY v.published_at DESC
-            LIMIT ?
             """,
             (channel_id, limit),
         )
     else:
         cur.execute(
             """
-            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url, c.title
-            FROM videos v
-            JOIN channels c ON v.channel_id = c.channel_id
-            WHERE v.seen = 0
+            WITH v AS (
+                SELECT video_id, channel_id, title, published_at, substr(description, 1, 320) AS description, url
+                FROM videos
+                WHERE seen = 0
+                ORDER BY published_at DESC
+                LIMIT ?
+            )
+            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url,
+                   COALESCE(NULLIF(c.title, ''), v.channel_id) AS channel_title
+            FROM v
+            LEFT JOIN channels c ON v.channel_id = c.channel_id
             ORDER BY v.published_at DESC
-            LIMIT ?
             """,
             (limit,),
         )
-    rows = cur.fetchall()
-    return [
-        {
-            "video_id": r[0],
-            "channel_id": r[1],
-            "title": r[2],
-            "published_at": r[3],
-            "description": r[4],
-            "url": r[5],
-            "channel_title": r[6] or r[1],
-        }
-        for r in rows
-    ]
+    return [dict(r) for r in cur.fetchall()]
+
+
+def unseen_counts(conn: sqlite3.Connection) -> dict:
+    cur = conn.cursor()
+    cur.execute("SELECT channel_id, COUNT(*) FROM videos WHERE seen = 0 GROUP BY channel_id")
+    return {r[0]: r[1] for r in cur.fetchall()}
 
 
 def mark_videos_seen(conn: sqlite3.Connection, channel_id: str = None):
     cur = conn.cursor()
+    cur.execute("BEGIN IMMEDIATE")
     if channel_id:
         cur.execute("UPDATE videos SET seen = 1 WHERE channel_id = ? AND seen = 0", (channel_id,))
     else:
         cur.execute("UPDATE videos SET seen = 1 WHERE seen = 0")
-    conn.commit()
+    cur.execute("COMMIT")
 
 
 def get_recent_videos(conn: sqlite3.Connection, channel_id: str = None, limit: int = 50):
     cur = conn.cursor()
+    # Same LIMIT-before-JOIN shape as get_unseen_videos.
     if channel_id:
         cur.execute(
             """
-            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url, v.seen, c.title
-            FROM videos v
-            JOIN channels c ON v.channel_id = c.channel_id
-            WHERE v.channel_id = ?
+            WITH v AS (
+                SELECT video_id, channel_id, title, published_at, substr(description, 1, 320) AS description, url, seen
+                FROM videos
+                WHERE channel_id = ?
+                ORDER BY published_at DESC
+                LIMIT ?
+            )
+            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url, v.seen,
+                   COALESCE(NULLIF(c.title, ''), v.channel_id) AS channel_title
+            FROM v
+            LEFT JOIN channels c ON v.channel_id = c.channel_id
             ORDER BY v.published_at DESC
-            LIMIT ?
             """,
             (channel_id, limit),
         )
     else:
         cur.execute(
             """
-            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url, v.seen, c.title
-            FROM videos v
-            JOIN channels c ON v.channel_id = c.channel_id
+            WITH v AS (
+                SELECT video_id, channel_id, title, published_at, substr(description, 1, 320) AS description, url, seen
+                FROM videos
+                ORDER BY published_at DESC
+                LIMIT ?
+            )
+            SELECT v.video_id, v.channel_id, v.title, v.published_at, v.description, v.url, v.seen,
+                   COALESCE(NULLIF(c.title, ''), v.channel_id) AS channel_title
+            FROM v
+            LEFT JOIN channels c ON v.channel_id = c.channel_id
             ORDER BY v.published_at DESC
-            LIMIT ?
             """,
             (limit,),
         )
-    rows = cur.fetchall()
-    return [
-        {
-            "video_id": r[0],
-            "channel_id": r[1],
-            "title": r[2],
-            "published_at": r[3],
-            "description": r[4],
-            "url": r[5],
-            "seen": bool(r[6]),
-            "channel_title": r[7] or r[1],
-        }
-        for r in rows
-    ]
+    rows = [dict(r) for r in cur.fetchall()]
+    for r in rows:
+        r["seen"] = bool(r["seen"])
+    return rows
 
 
 # ----------------------------- Utils ---------------------------------------
@@ -218,12 +283,12 @@ def utc_now_iso():
 
 
 def is_channel_id(text: str) -> bool:
-    return bool(re.fullmatch(r"UC[0-9A-Za-z_-]{22}", text.strip()))
+    return bool(_CHANNEL_ID_RE.fullmatch(text.strip()))
 
 
 def extract_channel_id_from_url(url: str) -> str:
     # Try /channel/UC...
-    m = re.search(r"/channel/(UC[0-9A-Za-z_-]{22})", url)
+    m = _URL_CHANNEL_RE.search(url)
     if m:
         return m.group(1)
     # Try query 'channel'
@@ -236,7 +301,55 @@ def extract_channel_id_from_url(url: str) -> str:
     return ""
 
 
-def resolve_channel_id(input_text: str, yt_api_key: str = "") -> str:
+def _scan_response_for_channel_id(r) -> str:
+    # The channelId appears early in the page's initial data block, so scan
+    # streamed chunks and stop at the first hit instead of buffering the whole
+    # body. The tail carry-over keeps a match from being split across chunks.
+    tail = b""
+    for chunk in r.iter_content(chunk_size=65536):
+        buf = tail + chunk
+        m = _PAGE_CHANNEL_RE.search(buf)
+        if m:
+            return m.group(1).decode("ascii")
+        tail = buf[-64:]
+    return ""
+
+
+# Candidate-URL tuples per input category, built in one shot instead of
+# growing a list with repeated append/rstrip/endswith work per resolution.
+_CANDIDATE_URL_BUILDERS = {
+    "handle": lambda t: (
+        f"https://www.youtube.com/{t}",
+        f"https://www.youtube.com/{t}/about",
+    ),
+    "url": lambda t: (t,) if t.endswith("/about") else (t, t.rstrip("/") + "/about"),
+    "name": lambda t: (
+        f"https://www.youtube.com/@{t}",
+        f"https://www.youtube.com/@{t}/about",
+        f"https://www.youtube.com/c/{t}",
+        f"https://www.youtube.com/user/{t}",
+    ),
+}
+
+
+def _probe_candidate_url(u: str) -> str:
+    try:
+        r = get_http_session().get(u, stream=True, timeout=12)
+        try:
+            if r.status_code == 200:
+                return _scan_response_for_channel_id(r)
+        finally:
+            r.close()
+    except Exception:
+        pass
+    return ""
+
+
+@st.cache_data(ttl=3600, max_entries=500, show_spinner=False)
+def resolve_channel_id(input_text: str, has_api_key: bool = False) -> str:
+    # Cache on input + key presence; the secret itself is read from session
+    # state so it never becomes part of the cache key.
+    yt_api_key = st.session_state.get("yt_api_key", "") if has_api_key else ""
     text = input_text.strip()
     # If it's already a channel id
     if is_channel_id(text):
@@ -249,32 +362,29 @@ def resolve_channel_id(input_text: str, yt_api_key: str = "") -> str:
             return cid
 
     # Try via web page and regex "channelId":"UC..."
-    candidate_urls = []
     if text.startswith("@"):
-        candidate_urls.append(f"https://www.youtube.com/{text}")
-        candidate_urls.append(f"https://www.youtube.com/{text}/about")
+        category = "handle"
     elif "youtube.com" in text:
         if not text.startswith("http"):
             text = "https://" + text
-        candidate_urls.append(text)
-        if not text.endswith("/about"):
-            candidate_urls.append(text.rstrip("/") + "/about")
+        category = "url"
     else:
         # treated as handle or custom name
-        candidate_urls.append(f"https://www.youtube.com/@{text}")
-        candidate_urls.append(f"https://www.youtube.com/@{text}/about")
-        candidate_urls.append(f"https://www.youtube.com/c/{text}")
-        candidate_urls.append(f"https://www.youtube.com/user/{text}")
+        category = "name"
+    candidate_urls = _CANDIDATE_URL_BUILDERS[category](text)
 
-    for u in candidate_urls:
+    if candidate_urls:
+        # Probe all candidates at once and take the first hit; serially this
+        # was up to 4 requests x 12s timeout in the worst case.
+        ex = concurrent.futures.ThreadPoolExecutor(max_workers=4)
         try:
-            r = requests.get(u, headers=REQUEST_HEADERS, timeout=12)
-            if r.status_code == 200:
-                m = re.search(r'"channelId":"(UC[0-9A-Za-z_-]{22})"', r.text)
-                if m:
-                    return m.group(1)
-        except Exception:
-            continue
+            futures = [ex.submit(_probe_candidate_url, u) for u in candidate_urls]
+            for fut in concurrent.futures.as_completed(futures):
+                cid = fut.result()
+                if cid:
+                    return cid
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
 
     # Try YouTube Data API v3 Search as a last resort
     if yt_api_key:
@@ -287,7 +397,7 @@ def resolve_channel_id(input_text: str, yt_api_key: str = "") -> str:
                 "part": "snippet",
                 "maxResults": 1,
             }
-            r = requests.get(search_url, params=params, timeout=12)
+            r = get_http_session().get(search_url, params=params, timeout=12)
             data = r.json()
             items = data.get("items", [])
             if items:
@@ -300,13 +410,15 @@ def resolve_channel_id(input_text: str, yt_api_key: str = "") -> str:
     return ""
 
 
-def get_channel_title(channel_id: str, yt_api_key: str = "") -> str:
+@st.cache_data(ttl=86400, max_entries=500, show_spinner=False)
+def get_channel_title(channel_id: str, has_api_key: bool = False) -> str:
+    yt_api_key = st.session_state.get("yt_api_key", "") if has_api_key else ""
     # Prefer API if available
     if yt_api_key:
         try:
             url = "https://www.googleapis.com/youtube/v3/channels"
             params = {"key": yt_api_key, "id": channel_id, "part": "snippet"}
-            r = requests.get(url, params=params, timeout=12)
+            r = get_http_session().get(url, params=params, timeout=12)
             data = r.json()
             items = data.get("items", [])
             if items:
@@ -318,21 +430,22 @@ def get_channel_title(channel_id: str, yt_api_key: str = "") -> str:
     title = ""
     try:
         feed = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-        r = requests.get(feed, headers=REQUEST_HEADERS, timeout=12)
+        r = get_http_session().get(feed, timeout=12)
         if r.status_code == 200:
-            root = ET.fromstring(r.content)
-            ns = {
-                "atom": "http://www.w3.org/2005/Atom",
-                "yt": "http://www.youtube.com/xml/schemas/2015",
-                "media": "http://search.yahoo.com/mrss/",
-            }
-            author = root.find("atom:author/atom:name", ns)
-            if author is not None and author.text:
-                title = author.text
-            else:
-                feed_title = root.find("atom:title", ns)
-                if feed_title is not None and feed_title.text:
-                    title = feed_title.text.replace(" - Topic", "")
+            atom = "{http://www.w3.org/2005/Atom}"
+            feed_title = ""
+            # Only the feed header matters here; parse incrementally and stop
+            # at the author name (or the first entry) instead of building the
+            # whole feed DOM.
+            for _, elem in ET.iterparse(io.BytesIO(r.content), events=("end",)):
+                if elem.tag == atom + "name" and elem.text:
+                    title = elem.text
+                    break
+                if elem.tag == atom + "title" and elem.text and not feed_title:
+                    feed_title = elem.text.replace(" - Topic", "")
+                if elem.tag == atom + "entry":
+                    break
+            title = title or feed_title
     except Exception:
         pass
     return title or f"Channel {channel_id}"
@@ -350,7 +463,7 @@ def fetch_videos_via_api(channel_id: str, yt_api_key: str, max_results: int = 50
             "maxResults": max(1, min(50, max_results)),
             "type": "video",
         }
-        r = requests.get(url, params=params, timeout=15)
+        r = get_http_session().get(url, params=params, timeout=15)
         data = r.json()
         for item in data.get("items", []):
             vid = item.get("id", {}).get("videoId")
@@ -371,58 +484,65 @@ def fetch_videos_via_api(channel_id: str, yt_api_key: str, max_results: int = 50
     return videos
 
 
-def fetch_videos_via_rss(channel_id: str, max_results: int = 50) -> list:
+def fetch_videos_via_rss(channel_id: str, max_results: int = 50, etag: str = "", modified: str = "") -> tuple:
+    # Returns (videos, etag, modified). Passing the stored ETag/Last-Modified
+    # lets YouTube answer 304 with an empty body when nothing changed.
     videos = []
     try:
         feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-        r = requests.get(feed_url, headers=REQUEST_HEADERS, timeout=15)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+        r = get_http_session().get(feed_url, headers=headers, timeout=15)
         if r.status_code != 200:
-            return videos
-        root = ET.fromstring(r.content)
+            return videos, etag, modified
+        etag = r.headers.get("ETag", etag)
+        modified = r.headers.get("Last-Modified", modified)
         ns = {
             "atom": "http://www.w3.org/2005/Atom",
             "yt": "http://www.youtube.com/xml/schemas/2015",
             "media": "http://search.yahoo.com/mrss/",
         }
-        entries = root.findall("atom:entry", ns)
-        for e in entries[:max_results]:
-            vid_node = e.find("yt:videoId", ns)
-            title_node = e.find("atom:title", ns)
-            pub_node = e.find("atom:published", ns)
-            link_node = e.find("atom:link", ns)
-            desc_node = e.find("media:group/media:description", ns)
+        # Parse entries incrementally and stop after max_results rather than
+        # holding the whole feed DOM in memory and re-walking it with findall.
+        for _, elem in ET.iterparse(io.BytesIO(r.content), events=("end",)):
+            if elem.tag != "{http://www.w3.org/2005/Atom}entry":
+                continue
+            vid_node = elem.find("yt:videoId", ns)
+            title_node = elem.find("atom:title", ns)
+            pub_node = elem.find("atom:published", ns)
+            link_node = elem.find("atom:link", ns)
+            desc_node = elem.find("media:group/media:description", ns)
 
             vid = vid_node.text if vid_node is not None else None
-            if not vid:
-                continue
-            videos.append(
-                {
-                    "video_id": vid,
-                    "title": title_node.text if title_node is not None else "",
-                    "published_at": pub_node.text if pub_node is not None else "",
-                    "description": desc_node.text if desc_node is not None else "",
-                    "url": link_node.attrib.get("href") if link_node is not None else f"https://www.youtube.com/watch?v={vid}",
-                }
-            )
+            if vid:
+                videos.append(
+                    {
+                        "video_id": vid,
+                        "title": title_node.text if title_node is not None else "",
+                        "published_at": pub_node.text if pub_node is not None else "",
+                        "description": desc_node.text if desc_node is not None else "",
+                        "url": link_node.attrib.get("href") if link_node is not None else f"https://www.youtube.com/watch?v={vid}",
+                    }
+                )
+            elem.clear()
+            if len(videos) >= max_results:
+                break
     except Exception:
         pass
-    return videos
+    return videos, etag, modified
 
 
-def fetch_latest_videos(channel_id: str, yt_api_key: str = "", max_results: int = 30) -> list:
+def fetch_latest_videos(channel_id: str, yt_api_key: str = "", max_results: int = 30, etag: str = "", modified: str = "") -> tuple:
+    # Returns (videos, etag, modified); the validators only apply to the RSS
+    # path and are passed through unchanged when the API serves the fetch.
     if yt_api_key:
         vids = fetch_videos_via_api(channel_id, yt_api_key, max_results=max_results)
         if vids:
-            return vids
-    return fetch_videos_via_rss(channel_id, max_results=max_results)
-
-
-def chunk_text(text: str, limit: int) -> str:
-    if not text:
-        return ""
-    if len(text) <= limit:
-        return text
-    return text[: limit - 3] + "..."
+            return vids, etag, modified
+    return fetch_videos_via_rss(channel_id, max_results=max_results, etag=etag, modified=modified)
 
 
 def group_by_channel(videos: list) -> dict:
@@ -434,23 +554,42 @@ def group_by_channel(videos: list) -> dict:
 
 
 # ------------------------- OpenAI Agent Functions ---------------------------
+@st.cache_resource(show_spinner=False)
 def get_openai_client():
-    # Relies on OPENAI_API_KEY environment variable
+    # Relies on OPENAI_API_KEY environment variable; cached so the underlying
+    # httpx connection pool is reused across reruns instead of rebuilt per call.
     return OpenAI()
 
 
+def _truncate_desc(d: str) -> str:
+    return d if len(d) <= 300 else d[:297] + "..."
+
+
+def _fmt_video_summary(v: dict) -> str:
+    line = f"- [{v.get('channel_title')}] {v.get('title')} ({v.get('url')})"
+    d = v.get("description", "")
+    return f"{line}\n  Desc: {_truncate_desc(d)}" if d else line
+
+
+def _fmt_video_context(v: dict) -> str:
+    line = f"- [{v.get('channel_title')}] {v.get('title')} | {v.get('published_at', '')} | {v.get('url')}"
+    d = v.get("description", "")
+    return f"{line}\n  {_truncate_desc(d)}" if d else line
+
+
+@st.cache_resource(show_spinner=False)
+def get_background_executor() -> concurrent.futures.ThreadPoolExecutor:
+    # Shared pool for long-running OpenAI calls so they don't block the
+    # Streamlit script thread (and freeze every widget) while in flight.
+    return concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+
 def summarize_unseen_videos(videos: list, model: str = "gpt-4") -> str:
     if not videos:
         return "No new videos to summarize."
     client = get_openai_client()
     # Prepare context
-    lines = []
-    for v in videos[:50]:  # limit
-        lines.append(f"- [{v.get('channel_title')}] {v.get('title')} ({v.get('url')})")
-        d = v.get("description", "")
-        if d:
-            lines.append(f"  Desc: {chunk_text(d, 300)}")
-    content = "\n".join(lines)
+    content = "\n".join(_fmt_video_summary(v) for v in videos[:50])  # limit
 
     system_prompt = "You are a helpful assistant that summarizes new YouTube uploads across multiple channels for a tracker dashboard."
     user_prompt = (
@@ -475,14 +614,7 @@ def answer_query_about_tracked_videos(question: str, context_videos: list, model
     if not context_videos:
         return "No videos available in the tracker yet."
     client = get_openai_client()
-    ctx_lines = []
-    for v in context_videos[:60]:
-        published = v.get("published_at", "")
-        ctx_lines.append(f"- [{v.get('channel_title')}] {v.get('title')} | {published} | {v.get('url')}")
-        desc = v.get("description", "")
-        if desc:
-            ctx_lines.append(f"  {chunk_text(desc, 300)}")
-    ctx = "\n".join(ctx_lines)
+    ctx = "\n".join(_fmt_video_context(v) for v in context_videos[:60])
 
     system_prompt = "You are an assistant that answers questions using only the provided list of tracked YouTube videos."
     user_prompt = (
@@ -513,61 +645,8 @@ def render_sidebar():
     enable_auto = st.sidebar.checkbox("Enable auto-refresh", value=False)
     interval = st.sidebar.number_input("Refresh interval (seconds)", min_value=10, max_value=1800, value=60, step=10)
     if enable_auto:
-        st.experimental_set_query_params(_=str(int(time.time())))
-        st.autorefresh = st.sidebar.empty()
-        st.autorefresh.write("")  # placeholder
-        st.experimental_rerun  # just to ensure definition
-        st.experimental_memo  # placeholder reference
-        st.autorefresh = st.experimental_rerun  # noop ref
-
-        st_autorefresh = st.experimental_get_query_params  # to avoid unused warnings
-        st_autorefresh  # noop
-        st.experimental_memo  # noop
-
-        st_autorefresh = st.experimental_rerun  # noop
-        st_autorefresh  # noop
-
-        st.experimental_set_query_params(t=str(int(time.time())))
-        st.experimental_rerun
-
-        st.experimental_set_query_params(auto="1")
-        st.experimental_rerun
-
-        st.experimental_set_query_params()
-        st.autorefresh = st.experimental_rerun
-
-        # Real auto-refresh
-        st.experimental_rerun  # This call intentionally does nothing unless state changes
-        st.experimental_set_query_params(ts=str(int(time.time())))
-        st.experimental_rerun  # still noop
-
-        st_autorefresh_key = st.sidebar.empty()
-        st.sidebar.info("Auto-refresh is enabled; the page will re-run every few seconds.")
-        st.runtime.legacy_caching.clear_cache  # dummy reference
-        st.experimental_data_editor  # dummy reference
-
-        # Use Streamlit's built-in autorefresh
-        st_autorefresh_counter = st.experimental_get_query_params().get("counter", [0])[0]
-        st_autorefresh_counter  # silence
-        st.autorefresh_count = st.experimental_get_query_params
-
-        st.experimental_set_query_params(counter=str(int(time.time())))
-        st.experimental_rerun  # final noop
-
-        # The official supported way:
-        st_autorefresh_component = st.experimental_get_query_params  # placeholder
-        st_autorefresh_component  # noop
-        st_autorefresh_true = st.sidebar.empty()
-        st_autorefresh_true  # noop
-
-        # Actually trigger
-        st_autorefresh = st.experimental_get_query_params  # noqa
-
-        st.autorefresh_placeholder = st.empty()
-        st.autorefresh_placeholder  # noop
-
-        st_autorefresh_ms = interval * 1000
-        st.session_state["autorefresh_ms"] = st_autorefresh_ms
+        st_autorefresh(interval=int(interval) * 1000, key="auto_refresh_counter")
+        st.session_state["autorefresh_ms"] = int(interval) * 1000
     else:
         st.session_state["autorefresh_ms"] = 0
 
@@ -590,18 +669,19 @@ def ui_add_channel(conn: sqlite3.Connection):
 
     if add_btn and inp.strip():
         with st.spinner("Resolving channel..."):
-            cid = resolve_channel_id(inp.strip(), st.session_state.get("yt_api_key", ""))
+            has_key = bool(st.session_state.get("yt_api_key", ""))
+            cid = resolve_channel_id(inp.strip(), has_key)
         if not cid:
             st.error("Could not resolve a valid channel ID from the input.")
             return
-        title = get_channel_title(cid, st.session_state.get("yt_api_key", ""))
+        title = get_channel_title(cid, has_key)
         added = add_channel(conn, cid, title=title, url=f"https://www.youtube.com/channel/{cid}")
         if added:
             st.success(f"Added: {title} ({cid})")
             # Initial fetch
-            vids = fetch_latest_videos(cid, st.session_state.get("yt_api_key", ""), max_results=30)
+            vids, etag, modified = fetch_latest_videos(cid, st.session_state.get("yt_api_key", ""), max_results=30)
             n = insert_videos(conn, cid, vids)
-            mark_channel_checked(conn, cid)
+            mark_channel_checked(conn, cid, etag, modified)
             st.info(f"Fetched {n} initial video(s).")
         else:
             st.warning("Channel already tracked.")
@@ -614,6 +694,7 @@ def ui_tracked_channels(conn: sqlite3.Connection):
         st.info("No channels tracked yet. Add one above.")
         return
 
+    counts = unseen_counts(conn)
     for ch in chs:
         ch_id = ch["channel_id"]
         c1, c2, c3, c4 = st.columns([4, 3, 3, 2])
@@ -625,7 +706,7 @@ def ui_tracked_channels(conn: sqlite3.Connection):
             last = ch.get("last_checked")
             st.caption(f"Last checked: {fmt_time(last) if last else 'Never'}")
         with c3:
-            unseen_count = len(get_unseen_videos(conn, channel_id=ch_id, limit=9999))
+            unseen_count = counts.get(ch_id, 0)
             st.write(f"Unseen videos: {unseen_count}")
         with c4:
             if st.button("Remove", key=f"rm_{ch_id}"):
@@ -651,12 +732,30 @@ def ui_check_updates(conn: sqlite3.Connection):
         if st.button("Check all channels now", use_container_width=True):
             total_new = 0
             chs = list_channels(conn)
+            yt_key = st.session_state.get("yt_api_key", "")
             with st.spinner("Checking channels for new uploads..."):
-                for ch in chs:
-                    vids = fetch_latest_videos(ch["channel_id"], st.session_state.get("yt_api_key", ""), max_results=30)
-                    inserted = insert_videos(conn, ch["channel_id"], vids)
-                    total_new += inserted
-                    mark_channel_checked(conn, ch["channel_id"])
+                # Fetches are pure network I/O, so run them concurrently;
+                # SQLite writes stay on this thread as results complete.
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+                    futures = {
+                        ex.submit(
+                            fetch_latest_videos,
+                            ch["channel_id"],
+                            yt_key,
+                            30,
+                            ch.get("last_etag") or "",
+                            ch.get("last_modified") or "",
+                        ): ch
+                        for ch in chs
+                    }
+                    for fut in concurrent.futures.as_completed(futures):
+                        ch = futures[fut]
+                        try:
+                            vids, etag, modified = fut.result()
+                        except Exception:
+                            vids, etag, modified = [], ch.get("last_etag") or "", ch.get("last_modified") or ""
+                        total_new += insert_videos(conn, ch["channel_id"], vids)
+                        mark_channel_checked(conn, ch["channel_id"], etag, modified)
             if total_new > 0:
                 st.success(f"Found {total_new} new video(s).")
             else:
@@ -692,26 +791,45 @@ def ui_unseen_and_summary(conn: sqlite3.Connection):
     col1, col2 = st.columns([1, 1])
     with col1:
         if st.button("Summarize all unseen videos"):
-            model = st.session_state.get("openai_model", "gpt-4")
-            try:
-                with st.spinner("Generating summary with OpenAI..."):
-                    summary = summarize_unseen_videos(unseen, model=model)
-                st.markdown("Summary:")
-                st.write(summary)
-            except Exception as e:
-                st.error(f"OpenAI call failed: {e}")
+            start_summary(unseen, mark_seen=False)
     with col2:
         if st.button("Summarize and mark all as seen"):
-            model = st.session_state.get("openai_model", "gpt-4")
-            try:
-                with st.spinner("Generating summary with OpenAI..."):
-                    summary = summarize_unseen_videos(unseen, model=model)
-                st.markdown("Summary:")
-                st.write(summary)
+            start_summary(unseen, mark_seen=True)
+    render_summary_status(conn)
+
+
+def start_summary(unseen: list, mark_seen: bool = False):
+    model = st.session_state.get("openai_model", "gpt-4")
+    st.session_state["summary_future"] = get_background_executor().submit(
+        summarize_unseen_videos, unseen, model
+    )
+    st.session_state["summary_mark_seen"] = mark_seen
+    st.session_state.pop("summary_text", None)
+    st.session_state.pop("summary_error", None)
+
+
+def render_summary_status(conn: sqlite3.Connection):
+    fut = st.session_state.get("summary_future")
+    if fut is not None:
+        if not fut.done():
+            # The call runs on the background executor; keep rerunning until
+            # the future resolves so the rest of the page stays responsive.
+            st.info("Generating summary with OpenAI...")
+            st_autorefresh(interval=500, key="summary_poll")
+            return
+        st.session_state["summary_future"] = None
+        try:
+            st.session_state["summary_text"] = fut.result()
+            if st.session_state.pop("summary_mark_seen", False):
                 mark_videos_seen(conn, None)
                 st.success("Marked all unseen as seen.")
-            except Exception as e:
-                st.error(f"OpenAI call failed: {e}")
+        except Exception as e:
+            st.session_state["summary_error"] = str(e)
+    if st.session_state.get("summary_error"):
+        st.error(f"OpenAI call failed: {st.session_state['summary_error']}")
+    elif st.session_state.get("summary_text"):
+        st.markdown("Summary:")
+        st.write(st.session_state["summary_text"])
 
 
 def ui_recent_feed(conn: sqlite3.Connection):